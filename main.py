@@ -7,6 +7,7 @@ load_dotenv()
 
 app = create_app()
 
+# Modo desarrollo (un proceso con reload). En producción usar serve.py.
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
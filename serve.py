@@ -0,0 +1,79 @@
+"""
+Punto de entrada de producción.
+
+    python serve.py --workers 4
+
+A diferencia de main.py (un proceso con reload), aquí se supervisan N procesos que
+comparten el mismo socket. Cada worker precalienta el pool y la caché de encuestas
+activas antes de aceptar conexiones (ver /ready), y al apagarse avisa a sus clientes
+WebSocket con un RECONNECT con retraso aleatorio antes de cerrar los sockets.
+
+Con más de un worker, cada proceso sincroniza votos y encuestas nuevas con los demás
+a través de la tabla `poll_events` (ver mysql_event_bus.py): así reciben POLL_UPDATE
+los clientes de cualquier worker y el buscador, el ranking y las series coinciden.
+La propagación entre workers tarda hasta EVENT_BUS_INTERVAL (0.2 s por defecto).
+Por defecto se usa un solo worker; --workers o WEB_CONCURRENCY lo cambian.
+"""
+import os
+import argparse
+import uvicorn
+from dotenv import load_dotenv
+from uvicorn.supervisors import Multiprocess
+
+load_dotenv()
+
+APP = "main:app"
+
+
+class DrainingServer(uvicorn.Server):
+
+    async def shutdown(self, sockets=None) -> None:
+        # uvicorn cierra las conexiones antes del shutdown del lifespan, así que el
+        # drenado tiene que ocurrir aquí, mientras los sockets siguen abiertos.
+        handler = getattr(getattr(_unwrap(self.config.loaded_app), "state", None), "handler", None)
+        if handler is not None:
+            try:
+                await handler.drain()
+            except Exception as e:
+                print(f"[Server] Error drenando conexiones: {type(e).__name__}: {e}")
+
+        await super().shutdown(sockets=sockets)
+
+
+def _unwrap(app):
+    """Quita los middlewares ASGI que uvicorn agrega (proxy headers, logging) hasta llegar a FastAPI."""
+    while not hasattr(app, "state") and hasattr(app, "app"):
+        app = app.app
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="LivePoll — servidor de producción")
+    parser.add_argument("--host",    default=os.getenv("WS_HOST", "0.0.0.0"))
+    parser.add_argument("--port",    type=int, default=int(os.getenv("WS_PORT", 8000)))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", 1)))
+    args = parser.parse_args()
+
+    # Los workers lo heredan y activan el bus de eventos solo si son más de uno.
+    os.environ["LIVEPOLL_WORKERS"] = str(args.workers)
+
+    config = uvicorn.Config(
+        APP,
+        host      = args.host,
+        port      = args.port,
+        workers   = args.workers,
+        log_level = "info",
+        timeout_graceful_shutdown = int(os.getenv("SHUTDOWN_TIMEOUT", 30)),
+    )
+    server = DrainingServer(config=config)
+
+    if config.workers > 1:
+        # El socket se abre una vez en el supervisor y lo heredan todos los workers.
+        sock = config.bind_socket()
+        Multiprocess(config, target=server.run, sockets=[sock]).run()
+    else:
+        server.run()
+
+
+if __name__ == "__main__":
+    main()
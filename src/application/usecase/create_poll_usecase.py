@@ -1,12 +1,21 @@
 import uuid
 from src.domain.model.poll import Poll
 from src.domain.port.poll_repository import IPollRepository
+from src.domain.port.poll_search_index import IPollSearchIndex
+from src.domain.port.poll_created_listener import IPollCreatedListener
 
 
 class CreatePollUseCase:
 
-    def __init__(self, repository: IPollRepository) -> None:
-        self._repository = repository
+    def __init__(
+        self,
+        repository:   IPollRepository,
+        search_index: IPollSearchIndex | None = None,
+        listeners:    list[IPollCreatedListener] | None = None,
+    ) -> None:
+        self._repository   = repository
+        self._search_index = search_index
+        self._listeners    = list(listeners or [])
 
     async def execute(self, question: str, options: list[str]) -> Poll:
         if not question or not question.strip():
@@ -22,4 +31,15 @@ class CreatePollUseCase:
         poll_id = uuid.uuid4().hex[:6].upper()
         poll    = Poll(id=poll_id, question=question, options=options)
 
-        return await self._repository.save(poll)
\ No newline at end of file
+        saved = await self._repository.save(poll)
+
+        if self._search_index is not None:
+            self._search_index.add(saved)
+
+        for listener in self._listeners:
+            try:
+                listener.on_poll_created(saved)
+            except Exception as e:
+                print(f"[CreatePollUseCase] Error en {type(listener).__name__}.on_poll_created: {type(e).__name__}: {e}")
+
+        return saved
\ No newline at end of file
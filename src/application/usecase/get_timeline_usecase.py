@@ -0,0 +1,40 @@
+from src.domain.exceptions import PollNotFoundError
+from src.domain.port.poll_repository import IPollRepository
+from src.domain.port.vote_timeline import IVoteTimeline
+
+
+class GetTimelineUseCase:
+
+    def __init__(self, repository: IPollRepository, timeline: IVoteTimeline) -> None:
+        self._repository = repository
+        self._timeline   = timeline
+
+    async def execute(self, poll_id: str, resolution: str = "1s") -> dict:
+        poll_id = self._validate(poll_id, resolution)
+
+        # Solo se consulta MySQL la primera vez que se pide una encuesta en este proceso.
+        if not self._timeline.has(poll_id):
+            poll = await self._repository.find_by_id(poll_id)
+            if poll is None:
+                raise PollNotFoundError(f"Encuesta '{poll_id}' no encontrada.")
+            await self._timeline.hydrate(poll)
+
+        return self._timeline.series(poll_id, resolution)
+
+    def recent(self, poll_id: str, resolution: str, count: int = 2) -> dict:
+        return self._timeline.recent(self._validate(poll_id, resolution), resolution, count)
+
+    async def persist(self) -> None:
+        await self._timeline.flush()
+
+    def _validate(self, poll_id: str, resolution: str) -> str:
+        if not poll_id or not poll_id.strip():
+            raise ValueError("El código de sala no puede estar vacío.")
+
+        if resolution not in self._timeline.resolutions:
+            raise ValueError(
+                f'Resolución inválida: "{resolution}". '
+                f'Resoluciones válidas: {", ".join(self._timeline.resolutions)}'
+            )
+
+        return poll_id.upper()
@@ -0,0 +1,41 @@
+import re
+from src.domain.port.trending_tracker import ITrendingTracker
+
+MAX_LIMIT = 100
+
+_WINDOW_RE = re.compile(r"^(\d+)([smh])$")
+_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600}
+
+
+def parse_window(window: str) -> int:
+    """Convierte "30s", "5m" o "1h" a segundos."""
+    match = _WINDOW_RE.match(window.strip().lower()) if window else None
+    if not match:
+        raise ValueError(f'Ventana inválida: "{window}". Usa el formato 30s, 5m o 1h.')
+    return int(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+
+
+class GetTrendingUseCase:
+
+    def __init__(self, tracker: ITrendingTracker) -> None:
+        self._tracker = tracker
+
+    async def execute(self, window: str = "5m", limit: int = 20) -> list[dict]:
+        window_seconds = parse_window(window)
+
+        if window_seconds not in self._tracker.windows:
+            supported = ", ".join(_format_window(w) for w in self._tracker.windows)
+            raise ValueError(f'Ventana no soportada: "{window}". Ventanas válidas: {supported}.')
+
+        if limit < 1 or limit > MAX_LIMIT:
+            raise ValueError(f"El límite debe estar entre 1 y {MAX_LIMIT}.")
+
+        return self._tracker.top(window_seconds, limit)
+
+
+def _format_window(seconds: int) -> str:
+    if seconds % 3600 == 0:
+        return f"{seconds // 3600}h"
+    if seconds % 60 == 0:
+        return f"{seconds // 60}m"
+    return f"{seconds}s"
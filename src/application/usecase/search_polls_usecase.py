@@ -0,0 +1,33 @@
+from src.domain.model.poll import Poll
+from src.domain.port.poll_repository import IPollRepository
+from src.domain.port.poll_search_index import IPollSearchIndex
+
+MAX_LIMIT = 100
+
+
+class SearchPollsUseCase:
+
+    def __init__(self, repository: IPollRepository, search_index: IPollSearchIndex) -> None:
+        self._repository   = repository
+        self._search_index = search_index
+
+    @property
+    def index_ready(self) -> bool:
+        return self._search_index.ready
+
+    async def execute(self, query: str, limit: int = 20, offset: int = 0) -> tuple[int, list[tuple[Poll, float]]]:
+        if not query or not query.strip():
+            raise ValueError("El texto de búsqueda no puede estar vacío.")
+
+        if limit < 1 or limit > MAX_LIMIT:
+            raise ValueError(f"El límite debe estar entre 1 y {MAX_LIMIT}.")
+
+        if offset < 0:
+            raise ValueError("El desplazamiento no puede ser negativo.")
+
+        return self._search_index.search(query, limit, offset)
+
+    async def rebuild_index(self) -> None:
+        """Reconstruye el índice desde el repositorio. Pensado para correr en segundo plano."""
+        polls = await self._repository.find_all_summaries()
+        await self._search_index.rebuild(polls)
@@ -1,11 +1,17 @@
 from src.domain.model.poll import Poll
 from src.domain.port.poll_repository import IPollRepository
+from src.domain.port.vote_listener import IVoteListener
 
 
 class VoteUseCase:
 
-    def __init__(self, repository: IPollRepository) -> None:
+    def __init__(self, repository: IPollRepository, listeners: list[IVoteListener] | None = None) -> None:
         self._repository = repository
+        self._listeners  = list(listeners or [])
+
+    def add_listener(self, listener: IVoteListener) -> None:
+        """Registra un listener creado después del caso de uso (por ejemplo, el handler WS)."""
+        self._listeners.append(listener)
 
     async def execute(self, poll_id: str, option_index: int) -> Poll:
         poll = await self._repository.find_by_id(poll_id.upper())
@@ -21,4 +27,13 @@ class VoteUseCase:
                 f"Opción inválida: {option_index}. "
                 f"La encuesta tiene {len(poll.options)} opciones (0 a {len(poll.options) - 1})."
             )
-        return await self._repository.register_vote(poll_id.upper(), option_index)
\ No newline at end of file
+        poll = await self._repository.register_vote(poll_id.upper(), option_index)
+
+        # El voto ya está guardado: un listener que falle no debe convertirlo en error.
+        for listener in self._listeners:
+            try:
+                listener.on_vote(poll, option_index)
+            except Exception as e:
+                print(f"[VoteUseCase] Error en {type(listener).__name__}.on_vote: {type(e).__name__}: {e}")
+
+        return poll
\ No newline at end of file
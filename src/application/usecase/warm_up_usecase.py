@@ -0,0 +1,16 @@
+import time
+from src.domain.port.poll_cache import IPollCache
+from src.domain.port.vote_rollup_repository import IVoteRollupRepository
+
+
+class WarmUpUseCase:
+
+    def __init__(self, cache: IPollCache, rollup_repository: IVoteRollupRepository) -> None:
+        self._cache   = cache
+        self._rollups = rollup_repository
+
+    async def execute(self, limit: int = 100, lookback_minutes: int = 60, ttl: float = 30.0) -> int:
+        """Deja en caché, durante `ttl` segundos, las encuestas con más votos recientes."""
+        since    = int(time.time() // 60) - lookback_minutes
+        poll_ids = await self._rollups.find_recently_active(since, limit)
+        return await self._cache.preload(poll_ids, ttl)
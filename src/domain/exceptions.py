@@ -0,0 +1,2 @@
+class PollNotFoundError(ValueError):
+    """La encuesta pedida no existe. Hereda de ValueError para no romper los manejadores existentes."""
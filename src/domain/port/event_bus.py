@@ -0,0 +1,12 @@
+from typing import Callable, Protocol
+
+
+class IEventBus(Protocol):
+
+    def publish(self, kind: str, payload: dict) -> None:
+        """Encola un evento para los demás procesos. No bloquea: el envío es asíncrono."""
+        ...
+
+    def subscribe(self, kind: str, callback: Callable[[dict], None]) -> None:
+        """Registra un callback para los eventos de otros procesos del tipo indicado."""
+        ...
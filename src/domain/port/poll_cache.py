@@ -0,0 +1,8 @@
+from typing import Protocol
+
+
+class IPollCache(Protocol):
+
+    async def preload(self, poll_ids: list[str], ttl: float) -> int:
+        """Carga encuestas en caché por al menos `ttl` segundos. Retorna cuántas existían."""
+        ...
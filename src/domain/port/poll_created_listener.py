@@ -0,0 +1,9 @@
+from typing import Protocol
+from src.domain.model.poll import Poll
+
+
+class IPollCreatedListener(Protocol):
+
+    def on_poll_created(self, poll: Poll) -> None:
+        """Se invoca tras guardar una encuesta nueva."""
+        ...
@@ -17,6 +17,10 @@ class IPollRepository(Protocol):
         """Obtiene todas las encuestas disponibles."""
         ...
 
+    async def find_all_summaries(self) -> list[Poll]:
+        """Obtiene todas las encuestas con pregunta y opciones, sin calcular conteos de votos."""
+        ...
+
     async def register_vote(self, poll_id: str, option_index: int) -> Poll:
         """Registra un voto y retorna la encuesta con conteos actualizados."""
         ...
@@ -0,0 +1,22 @@
+from typing import Protocol
+from src.domain.model.poll import Poll
+
+
+class IPollSearchIndex(Protocol):
+
+    def add(self, poll: Poll) -> None:
+        """Indexa (o reindexa) la pregunta y opciones de una encuesta."""
+        ...
+
+    async def rebuild(self, polls: list[Poll]) -> None:
+        """Carga masiva del índice a partir de un listado completo de encuestas."""
+        ...
+
+    def search(self, query: str, limit: int, offset: int) -> tuple[int, list[tuple[Poll, float]]]:
+        """Retorna el total de coincidencias y la página pedida como pares (encuesta, puntaje)."""
+        ...
+
+    @property
+    def ready(self) -> bool:
+        """Indica si la carga inicial del índice ya terminó."""
+        ...
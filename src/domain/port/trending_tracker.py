@@ -0,0 +1,14 @@
+from typing import Protocol
+from src.domain.port.vote_listener import IVoteListener
+
+
+class ITrendingTracker(IVoteListener, Protocol):
+
+    @property
+    def windows(self) -> tuple[int, ...]:
+        """Ventanas soportadas, en segundos."""
+        ...
+
+    def top(self, window_seconds: int, limit: int) -> list[dict]:
+        """Encuestas más activas en la ventana, de mayor a menor actividad."""
+        ...
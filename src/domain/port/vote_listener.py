@@ -0,0 +1,9 @@
+from typing import Protocol
+from src.domain.model.poll import Poll
+
+
+class IVoteListener(Protocol):
+
+    def on_vote(self, poll: Poll, option_index: int) -> None:
+        """Se invoca tras registrar un voto, con la encuesta ya actualizada."""
+        ...
@@ -0,0 +1,16 @@
+from typing import Protocol
+
+
+class IVoteRollupRepository(Protocol):
+
+    async def add_minute_rollups(self, rows: list[tuple[str, int, int, int]]) -> None:
+        """Suma conteos por minuto: filas (poll_id, posición de opción, minuto epoch, votos)."""
+        ...
+
+    async def find_minute_rollups(self, poll_id: str, since_minute: int) -> list[tuple[int, int, int]]:
+        """Conteos por minuto desde `since_minute`: filas (posición de opción, minuto epoch, votos)."""
+        ...
+
+    async def find_recently_active(self, since_minute: int, limit: int) -> list[str]:
+        """IDs de las encuestas con más votos desde `since_minute`, de mayor a menor."""
+        ...
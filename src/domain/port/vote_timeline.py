@@ -0,0 +1,31 @@
+from typing import Protocol
+from src.domain.model.poll import Poll
+from src.domain.port.vote_listener import IVoteListener
+
+
+class IVoteTimeline(IVoteListener, Protocol):
+
+    @property
+    def resolutions(self) -> tuple[str, ...]:
+        """Resoluciones soportadas, por ejemplo ("1s", "1m")."""
+        ...
+
+    def has(self, poll_id: str) -> bool:
+        """Indica si la encuesta ya tiene serie cargada en memoria."""
+        ...
+
+    async def hydrate(self, poll: Poll) -> None:
+        """Carga en memoria los conteos persistidos de una encuesta."""
+        ...
+
+    def series(self, poll_id: str, resolution: str) -> dict:
+        """Serie completa de votos por opción en la resolución pedida."""
+        ...
+
+    def recent(self, poll_id: str, resolution: str, count: int) -> dict:
+        """Últimos `count` intervalos de la serie, para enviar actualizaciones incrementales."""
+        ...
+
+    async def flush(self) -> None:
+        """Persiste los conteos acumulados desde la última llamada."""
+        ...
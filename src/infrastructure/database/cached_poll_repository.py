@@ -0,0 +1,109 @@
+import asyncio
+import time
+from src.domain.model.poll import Poll
+from src.domain.port.poll_cache import IPollCache
+from src.domain.port.poll_repository import IPollRepository
+from src.domain.port.vote_listener import IVoteListener
+
+MAX_ENTRIES = 10_000
+
+
+class CachedPollRepository(IPollRepository, IPollCache, IVoteListener):
+    """
+    Caché en memoria de `find_by_id` delante de otro repositorio.
+
+    Las lecturas concurrentes de una misma encuesta comparten una sola consulta, de modo
+    que una ola de JOIN_POLL tras un reinicio cuesta una consulta por encuesta y no una
+    por cliente. `save` y `register_vote` dejan la entidad fresca en caché.
+
+    `preload` fija entradas con un TTL propio, más largo, para que sigan en caché
+    mientras dura la ola de reconexiones; refrescarlas no acorta ese plazo. Como
+    listener de votos de otros workers, actualiza las entradas que ya estén en caché.
+    """
+
+    def __init__(self, inner: IPollRepository, ttl: float = 2.0) -> None:
+        self._inner    = inner
+        self._ttl      = ttl
+        self._entries:  dict[str, tuple[float, Poll]] = {}
+        self._inflight: dict[str, asyncio.Future]     = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def save(self, poll: Poll) -> Poll:
+        saved = await self._inner.save(poll)
+        self._put(saved)
+        return saved
+
+    async def find_by_id(self, poll_id: str) -> Poll | None:
+        entry = self._entries.get(poll_id)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        inflight = self._inflight.get(poll_id)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Si quien consultaba fue cancelado, se reintenta; si el cancelado es este, se propaga.
+                if not inflight.cancelled():
+                    raise
+                return await self.find_by_id(poll_id)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[poll_id] = future
+        try:
+            poll = await self._inner.find_by_id(poll_id)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Evita el aviso de excepción no recuperada si nadie más esperaba.
+            future.exception()
+            raise
+        else:
+            future.set_result(poll)
+            if poll is not None:
+                self._put(poll)
+            return poll
+        finally:
+            del self._inflight[poll_id]
+
+    async def preload(self, poll_ids: list[str], ttl: float) -> int:
+        polls = await asyncio.gather(*[self._inner.find_by_id(pid) for pid in poll_ids])
+        for poll in polls:
+            if poll is not None:
+                self._put(poll, ttl)
+        return sum(1 for poll in polls if poll is not None)
+
+    async def find_all(self) -> list[Poll]:
+        return await self._inner.find_all()
+
+    async def find_all_summaries(self) -> list[Poll]:
+        return await self._inner.find_all_summaries()
+
+    async def register_vote(self, poll_id: str, option_index: int) -> Poll:
+        poll = await self._inner.register_vote(poll_id, option_index)
+        self._put(poll)
+        return poll
+
+    def on_vote(self, poll: Poll, option_index: int) -> None:
+        # Los eventos de distintos workers pueden llegar desordenados: no se retrocede.
+        entry = self._entries.get(poll.id)
+        if entry is not None and poll.get_total_votes() >= entry[1].get_total_votes():
+            self._put(poll)
+
+    def _put(self, poll: Poll, ttl: float | None = None) -> None:
+        expires = time.monotonic() + (self._ttl if ttl is None else ttl)
+        current = self._entries.get(poll.id)
+        if current is not None:
+            expires = max(expires, current[0])
+        self._entries[poll.id] = (expires, poll)
+        if len(self._entries) > MAX_ENTRIES:
+            self._evict_expired()
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for poll_id in [pid for pid, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[poll_id]
@@ -1,4 +1,5 @@
 import os
+import asyncio
 import aiomysql
 from dotenv import load_dotenv
 
@@ -16,8 +17,8 @@ async def create_pool() -> aiomysql.Pool:
         password = os.getenv("DB_PASSWORD", ""),
         db       = os.getenv("DB_NAME", "livepoll"),
         autocommit = False,
-        minsize  = 2,
-        maxsize  = 10,
+        minsize  = int(os.getenv("DB_POOL_MIN", 2)),
+        maxsize  = int(os.getenv("DB_POOL_MAX", 10)),
         charset  = "utf8mb4",
     )
     print("[DB] Pool de conexiones MySQL creado ✓")
@@ -32,6 +33,22 @@ def get_pool() -> aiomysql.Pool:
     return _pool
 
 
+async def ping() -> None:
+    """Ejecuta SELECT 1 sobre una conexión del pool. Lanza la excepción del driver si falla."""
+    async with get_pool().acquire() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute("SELECT 1")
+
+
+async def warm_pool() -> None:
+    """Abre y verifica las conexiones mínimas del pool antes de recibir tráfico."""
+    pool = get_pool()
+
+    # Se piden en paralelo para que cada ping use una conexión distinta.
+    await asyncio.gather(*[ping() for _ in range(pool.minsize)])
+    print(f"[DB] Pool precalentado: {pool.minsize} conexiones listas ✓")
+
+
 async def close_pool() -> None:
     """Cierra el pool al apagar el servidor."""
     global _pool
@@ -137,6 +137,33 @@ class MySQLPollRepository(IPollRepository):
         
         return retrieved_poll
 
+    async def find_all_summaries(self) -> list[Poll]:
+        """Una sola consulta para todas las encuestas y sus opciones; los votos quedan en cero."""
+        pool = get_pool()
+
+        async with pool.acquire() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cur:
+                await cur.execute(
+                    """
+                    SELECT p.id, p.question, p.active, o.text
+                    FROM polls p
+                    JOIN options o ON o.poll_id = p.id
+                    ORDER BY p.id, o.position
+                    """
+                )
+                rows = await cur.fetchall()
+
+        grouped: dict[str, tuple[str, bool, list[str]]] = {}
+        for row in rows:
+            if row["id"] not in grouped:
+                grouped[row["id"]] = (row["question"], bool(row["active"]), [])
+            grouped[row["id"]][2].append(row["text"])
+
+        return [
+            Poll(id=poll_id, question=question, options=options, active=active)
+            for poll_id, (question, active, options) in grouped.items()
+        ]
+
     async def find_all(self) -> list[Poll]:
         """Obtiene todas las encuestas disponibles."""
         pool = get_pool()
@@ -0,0 +1,68 @@
+import aiomysql
+from src.domain.port.vote_rollup_repository import IVoteRollupRepository
+from src.infrastructure.database.database import get_pool
+
+# Tabla requerida:
+#
+#   CREATE TABLE vote_rollups (
+#       poll_id   VARCHAR(6) NOT NULL,
+#       position  INT        NOT NULL,
+#       minute_ts BIGINT     NOT NULL,  -- epoch en minutos
+#       votes     INT        NOT NULL DEFAULT 0,
+#       PRIMARY KEY (poll_id, minute_ts, position)
+#   );
+
+
+class MySQLVoteRollupRepository(IVoteRollupRepository):
+
+    async def add_minute_rollups(self, rows: list[tuple[str, int, int, int]]) -> None:
+        if not rows:
+            return
+
+        pool = get_pool()
+
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                try:
+                    await conn.begin()
+                    await cur.executemany(
+                        "INSERT INTO vote_rollups (poll_id, position, minute_ts, votes) "
+                        "VALUES (%s, %s, %s, %s) "
+                        "ON DUPLICATE KEY UPDATE votes = votes + VALUES(votes)",
+                        rows
+                    )
+                    await conn.commit()
+                    print(f"[MySQLRollupRepo] {len(rows)} conteos por minuto persistidos")
+
+                except Exception as e:
+                    await conn.rollback()
+                    print(f"[MySQLRollupRepo] Error persistiendo conteos: {type(e).__name__}: {e}")
+                    raise RuntimeError(f"Error persistiendo conteos por minuto: {e}") from e
+
+    async def find_minute_rollups(self, poll_id: str, since_minute: int) -> list[tuple[int, int, int]]:
+        pool = get_pool()
+
+        async with pool.acquire() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cur:
+                await cur.execute(
+                    "SELECT position, minute_ts, votes FROM vote_rollups "
+                    "WHERE poll_id = %s AND minute_ts >= %s",
+                    (poll_id, since_minute)
+                )
+                rows = await cur.fetchall()
+
+        return [(int(r["position"]), int(r["minute_ts"]), int(r["votes"])) for r in rows]
+
+    async def find_recently_active(self, since_minute: int, limit: int) -> list[str]:
+        pool = get_pool()
+
+        async with pool.acquire() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cur:
+                await cur.execute(
+                    "SELECT poll_id, SUM(votes) AS total FROM vote_rollups "
+                    "WHERE minute_ts >= %s GROUP BY poll_id ORDER BY total DESC LIMIT %s",
+                    (since_minute, limit)
+                )
+                rows = await cur.fetchall()
+
+        return [row["poll_id"] for row in rows]
@@ -1,22 +1,60 @@
+import os
 from src.infrastructure.database.mysql.mysql_poll_repository import MySQLPollRepository
+from src.infrastructure.database.cached_poll_repository       import CachedPollRepository
+from src.infrastructure.database.mysql.mysql_vote_rollup_repository import MySQLVoteRollupRepository
 from src.application.usecase.create_poll_usecase              import CreatePollUseCase
 from src.application.usecase.get_poll_usecase                 import GetPollUseCase
 from src.application.usecase.vote_usecase                     import VoteUseCase
+from src.application.usecase.search_polls_usecase             import SearchPollsUseCase
+from src.application.usecase.get_trending_usecase             import GetTrendingUseCase
+from src.application.usecase.get_timeline_usecase             import GetTimelineUseCase
+from src.application.usecase.warm_up_usecase                  import WarmUpUseCase
+from src.infrastructure.search.poll_search_index              import InMemoryPollSearchIndex
+from src.infrastructure.metrics.trending_tracker              import DecayedTrendingTracker
+from src.infrastructure.metrics.vote_timeline                 import RingBufferVoteTimeline
+from src.infrastructure.messaging.mysql_event_bus             import MySQLEventBus
+from src.infrastructure.messaging.cluster_sync                import ClusterSync
 from src.infrastructure.websocket.websocket_handler           import WebSocketHandler
 
 
-def build_handler() -> WebSocketHandler:
+def build_event_bus() -> MySQLEventBus | None:
+    """Solo hace falta sincronizar cuando serve.py levanta más de un worker."""
+    if int(os.getenv("LIVEPOLL_WORKERS", 1)) <= 1:
+        return None
+    return MySQLEventBus(poll_interval=float(os.getenv("EVENT_BUS_INTERVAL", 0.2)))
+
+
+def build_handler(event_bus: MySQLEventBus | None = None) -> WebSocketHandler:
   
-    repository = MySQLPollRepository()
+    repository   = CachedPollRepository(MySQLPollRepository(), ttl=float(os.getenv("POLL_CACHE_TTL", 5)))
+    rollups      = MySQLVoteRollupRepository()
+    search_index = InMemoryPollSearchIndex()
+    trending     = DecayedTrendingTracker()
+    timeline     = RingBufferVoteTimeline(rollups)
+    cluster      = ClusterSync(event_bus, search_index) if event_bus is not None else None
+    cluster_listeners = [cluster] if cluster is not None else []
 
-    create_poll_usecase = CreatePollUseCase(repository)
-    get_poll_usecase    = GetPollUseCase(repository)
-    vote_usecase        = VoteUseCase(repository)
+    create_poll_usecase  = CreatePollUseCase(repository, search_index, listeners=cluster_listeners)
+    get_poll_usecase     = GetPollUseCase(repository)
+    vote_usecase         = VoteUseCase(repository, listeners=[trending, timeline, *cluster_listeners])
+    search_polls_usecase = SearchPollsUseCase(repository, search_index)
+    get_trending_usecase = GetTrendingUseCase(trending)
+    get_timeline_usecase = GetTimelineUseCase(repository, timeline)
+    warm_up_usecase      = WarmUpUseCase(cache=repository, rollup_repository=rollups)
 
     handler = WebSocketHandler(
-        create_poll_usecase = create_poll_usecase,
-        get_poll_usecase    = get_poll_usecase,
-        vote_usecase        = vote_usecase,
+        create_poll_usecase  = create_poll_usecase,
+        get_poll_usecase     = get_poll_usecase,
+        vote_usecase         = vote_usecase,
+        search_polls_usecase = search_polls_usecase,
+        get_trending_usecase = get_trending_usecase,
+        get_timeline_usecase = get_timeline_usecase,
+        warm_up_usecase      = warm_up_usecase,
     )
+    vote_usecase.add_listener(handler)
+
+    if cluster is not None:
+        for listener in (trending, timeline.replica, repository, handler):
+            cluster.add_remote_vote_listener(listener)
 
     return handler
\ No newline at end of file
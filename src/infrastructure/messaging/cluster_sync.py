@@ -0,0 +1,64 @@
+from src.domain.model.poll import Poll
+from src.domain.port.event_bus import IEventBus
+from src.domain.port.poll_created_listener import IPollCreatedListener
+from src.domain.port.poll_search_index import IPollSearchIndex
+from src.domain.port.vote_listener import IVoteListener
+
+
+class ClusterSync(IVoteListener, IPollCreatedListener):
+    """
+    Reparte entre workers los votos y las encuestas nuevas.
+
+    Como listener local publica cada evento en el bus; los eventos que llegan de otros
+    procesos se aplican al índice de búsqueda y a los listeners remotos (ranking, series,
+    caché y difusión a las salas WebSocket de este proceso).
+    """
+
+    def __init__(self, event_bus: IEventBus, search_index: IPollSearchIndex) -> None:
+        self._bus          = event_bus
+        self._search_index = search_index
+        self._remote_vote_listeners: list[IVoteListener] = []
+
+        self._bus.subscribe("VOTE",         self._on_remote_vote)
+        self._bus.subscribe("POLL_CREATED", self._on_remote_poll_created)
+
+    def add_remote_vote_listener(self, listener: IVoteListener) -> None:
+        self._remote_vote_listeners.append(listener)
+
+    def on_vote(self, poll: Poll, option_index: int) -> None:
+        self._bus.publish("VOTE", {"poll": _snapshot(poll), "optionIndex": option_index})
+
+    def on_poll_created(self, poll: Poll) -> None:
+        self._bus.publish("POLL_CREATED", {"poll": _snapshot(poll)})
+
+    def _on_remote_vote(self, payload: dict) -> None:
+        poll         = _restore(payload["poll"])
+        option_index = int(payload["optionIndex"])
+        for listener in self._remote_vote_listeners:
+            try:
+                listener.on_vote(poll, option_index)
+            except Exception as e:
+                print(f"[ClusterSync] Error en {type(listener).__name__}.on_vote: {type(e).__name__}: {e}")
+
+    def _on_remote_poll_created(self, payload: dict) -> None:
+        self._search_index.add(_restore(payload["poll"]))
+
+
+def _snapshot(poll: Poll) -> dict:
+    return {
+        "id":       poll.id,
+        "question": poll.question,
+        "options":  poll.options,
+        "votes":    poll.votes,
+        "active":   poll.active,
+    }
+
+
+def _restore(data: dict) -> Poll:
+    return Poll(
+        id       = data["id"],
+        question = data["question"],
+        options  = list(data["options"]),
+        votes    = list(data["votes"]),
+        active   = bool(data["active"]),
+    )
@@ -0,0 +1,190 @@
+import json
+import time
+import uuid
+import asyncio
+from typing import Callable
+import aiomysql
+from src.domain.port.event_bus import IEventBus
+from src.infrastructure.database.database import get_pool
+
+# Tabla requerida:
+#
+#   CREATE TABLE poll_events (
+#       id         BIGINT      NOT NULL AUTO_INCREMENT PRIMARY KEY,
+#       origin     CHAR(32)    NOT NULL,
+#       kind       VARCHAR(32) NOT NULL,
+#       payload    JSON        NOT NULL,
+#       created_at TIMESTAMP   NOT NULL DEFAULT CURRENT_TIMESTAMP,
+#       INDEX (created_at)
+#   );
+
+READ_BATCH        = 1000
+# Un id que falta puede ser una transacción aún sin confirmar; se sigue buscando un rato.
+GAP_TIMEOUT       = 5.0
+MAX_TRACKED_GAP   = 1000
+CLEANUP_INTERVAL  = 300.0
+# Si MySQL no responde, la cola no crece sin límite: se descartan los eventos más viejos.
+MAX_OUTBOX        = 1000
+
+
+class MySQLEventBus(IEventBus):
+    """
+    Bus de eventos entre workers sobre una tabla de MySQL.
+
+    `publish` solo encola; `run()` escribe la cola en lote y lee los eventos nuevos de
+    otros procesos cada `poll_interval` segundos. `start()` se llama en el arranque y
+    falla si la tabla no existe. Los ids auto-incrementales pueden confirmarse fuera
+    de orden, así que los huecos se vuelven a consultar durante GAP_TIMEOUT segundos
+    antes de darlos por perdidos.
+    """
+
+    def __init__(self, poll_interval: float = 0.2, retention_minutes: int = 60, max_outbox: int = MAX_OUTBOX) -> None:
+        self._interval   = poll_interval
+        self._retention  = retention_minutes
+        self._max_outbox = max_outbox
+        self._origin     = uuid.uuid4().hex
+        self._outbox:     list[tuple[str, str]]                   = []
+        self._handlers:   dict[str, list[Callable[[dict], None]]] = {}
+        self._gaps:       dict[int, float]                        = {}
+        self._last_sync:  float | None                            = None
+        self._last_error: str | None                              = None
+        self._cursor       = 0
+        self._dropped      = 0
+        self._logged_drops = 0
+        self._last_cleanup = 0.0
+
+    def publish(self, kind: str, payload: dict) -> None:
+        self._outbox.append((kind, json.dumps(payload)))
+        self._trim_outbox()
+
+    def status(self) -> dict:
+        """Estado para /ready: segundos desde la última sincronización completa y tamaño de la cola."""
+        return {
+            "secondsSinceSync": None if self._last_sync is None else round(time.monotonic() - self._last_sync, 1),
+            "outbox":           len(self._outbox),
+            "dropped":          self._dropped,
+            "lastError":        self._last_error,
+        }
+
+    def is_healthy(self, max_lag: float) -> bool:
+        return self._last_sync is not None and time.monotonic() - self._last_sync <= max_lag
+
+    async def start(self) -> None:
+        """Fija el cursor en el último evento existente. Falla si la tabla no existe."""
+        async with get_pool().acquire() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cur:
+                await cur.execute("SELECT COALESCE(MAX(id), 0) AS last_id FROM poll_events")
+                self._cursor = int((await cur.fetchone())["last_id"])
+                await conn.commit()
+        self._last_sync = time.monotonic()
+
+    def subscribe(self, kind: str, callback: Callable[[dict], None]) -> None:
+        self._handlers.setdefault(kind, []).append(callback)
+
+    async def run(self) -> None:
+        print(f"[EventBus] Sincronizando workers cada {self._interval}s (origen {self._origin[:8]})")
+        while True:
+            if self._dropped > self._logged_drops:
+                print(f"[EventBus] Cola llena: {self._dropped - self._logged_drops} eventos descartados "
+                      f"({self._dropped} en total)")
+                self._logged_drops = self._dropped
+            try:
+                await self._write_outbox()
+                await self._read_new()
+                if time.monotonic() - self._last_cleanup >= CLEANUP_INTERVAL:
+                    await self._cleanup()
+                self._last_sync  = time.monotonic()
+                self._last_error = None
+            except Exception as e:
+                self._last_error = f"{type(e).__name__}: {e}"
+                print(f"[EventBus] Error sincronizando: {self._last_error}")
+            await asyncio.sleep(self._interval)
+
+    async def close(self) -> None:
+        """Envía lo que quede en la cola antes de apagar."""
+        try:
+            await self._write_outbox()
+        except Exception as e:
+            print(f"[EventBus] Eventos sin enviar al apagar: {type(e).__name__}: {e}")
+
+    async def _write_outbox(self) -> None:
+        if not self._outbox:
+            return
+
+        batch, self._outbox = self._outbox, []
+        pool = get_pool()
+        try:
+            async with pool.acquire() as conn:
+                async with conn.cursor() as cur:
+                    try:
+                        await conn.begin()
+                        await cur.executemany(
+                            "INSERT INTO poll_events (origin, kind, payload) VALUES (%s, %s, %s)",
+                            [(self._origin, kind, payload) for kind, payload in batch]
+                        )
+                        await conn.commit()
+                    except BaseException:
+                        await conn.rollback()
+                        raise
+        except BaseException:
+            self._outbox = batch + self._outbox
+            self._trim_outbox()
+            raise
+
+    def _trim_outbox(self) -> None:
+        overflow = len(self._outbox) - self._max_outbox
+        if overflow > 0:
+            del self._outbox[:overflow]
+            self._dropped += overflow
+
+    async def _read_new(self) -> None:
+        pool = get_pool()
+        now  = time.monotonic()
+        self._gaps = {gid: seen for gid, seen in self._gaps.items() if now - seen < GAP_TIMEOUT}
+
+        async with pool.acquire() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cur:
+                sql    = "SELECT id, origin, kind, payload FROM poll_events WHERE id > %s"
+                params = [self._cursor]
+                if self._gaps:
+                    sql += f" OR id IN ({', '.join(['%s'] * len(self._gaps))})"
+                    params.extend(self._gaps)
+                sql += " ORDER BY id LIMIT %s"
+                params.append(READ_BATCH)
+
+                await cur.execute(sql, params)
+                rows = await cur.fetchall()
+                # Cierra la transacción implícita para que la próxima lectura vea filas nuevas.
+                await conn.commit()
+
+        for row in rows:
+            event_id = int(row["id"])
+            if event_id > self._cursor:
+                if event_id - self._cursor <= MAX_TRACKED_GAP:
+                    for missing in range(self._cursor + 1, event_id):
+                        self._gaps[missing] = now
+                self._cursor = event_id
+            else:
+                self._gaps.pop(event_id, None)
+
+            if row["origin"] != self._origin:
+                self._dispatch(row["kind"], row["payload"])
+
+    def _dispatch(self, kind: str, raw_payload) -> None:
+        payload = json.loads(raw_payload) if isinstance(raw_payload, (str, bytes)) else raw_payload
+        for callback in self._handlers.get(kind, []):
+            try:
+                callback(payload)
+            except Exception as e:
+                print(f"[EventBus] Error procesando {kind}: {type(e).__name__}: {e}")
+
+    async def _cleanup(self) -> None:
+        pool = get_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    "DELETE FROM poll_events WHERE created_at < NOW() - INTERVAL %s MINUTE",
+                    (self._retention,)
+                )
+                await conn.commit()
+        self._last_cleanup = time.monotonic()
@@ -0,0 +1,116 @@
+import bisect
+import math
+import time
+from src.domain.model.poll import Poll
+from src.domain.port.trending_tracker import ITrendingTracker
+
+DEFAULT_WINDOWS = (60, 300, 900, 3600)
+
+# Por debajo de este conteo decaído una encuesta deja de considerarse activa y se descarta.
+MIN_SCORE      = 0.05
+PRUNE_INTERVAL = 30.0
+
+
+class _DecayedRanking:
+    """
+    Contadores con decaimiento exponencial ordenados por actividad.
+
+    La ventana es la constante de tiempo `tau`: un voto pesa e^(-edad/tau), es decir
+    ~0.37 tras una ventana y ~0.05 tras tres. Con un ritmo de votos constante, el
+    puntaje converge a los votos recibidos en una ventana.
+
+    Cada puntaje se guarda en espacio logarítmico relativo a un instante fijo
+    ("forward decay"): sumar un voto en t equivale a logaddexp(score, t / tau), y el
+    orden entre encuestas no cambia con el paso del tiempo. Así `_order` se mantiene
+    ordenado con bisect y el top-N se lee desde el final en O(limit).
+    """
+
+    def __init__(self, window_seconds: int) -> None:
+        self._tau    = float(window_seconds)
+        self._scores: dict[str, float]        = {}
+        self._order:  list[tuple[float, str]] = []
+
+    def record(self, poll_id: str, now: float) -> None:
+        x   = now / self._tau
+        old = self._scores.get(poll_id)
+
+        if old is None:
+            new = x
+        else:
+            self._order.pop(bisect.bisect_left(self._order, (old, poll_id)))
+            high, low = (old, x) if old > x else (x, old)
+            new = high + math.log1p(math.exp(low - high))
+
+        self._scores[poll_id] = new
+        bisect.insort(self._order, (new, poll_id))
+
+    def top(self, limit: int, now: float) -> list[tuple[str, float]]:
+        offset = now / self._tau
+        return [
+            (poll_id, math.exp(score - offset))
+            for score, poll_id in reversed(self._order[-limit:])
+        ]
+
+    def prune(self, now: float) -> None:
+        cutoff = now / self._tau + math.log(MIN_SCORE)
+        k = bisect.bisect_left(self._order, (cutoff, ""))
+        for _, poll_id in self._order[:k]:
+            del self._scores[poll_id]
+        del self._order[:k]
+
+    def __contains__(self, poll_id: str) -> bool:
+        return poll_id in self._scores
+
+
+class DecayedTrendingTracker(ITrendingTracker):
+    """Ranking en memoria de las encuestas con más votos recientes, alimentado por VoteUseCase."""
+
+    def __init__(self, windows: tuple[int, ...] = DEFAULT_WINDOWS) -> None:
+        self._windows  = tuple(sorted(windows))
+        self._rankings = {w: _DecayedRanking(w) for w in self._windows}
+        self._meta:    dict[str, dict] = {}
+        self._epoch    = time.monotonic()
+        self._last_prune = 0.0
+
+    @property
+    def windows(self) -> tuple[int, ...]:
+        return self._windows
+
+    def on_vote(self, poll: Poll, option_index: int) -> None:
+        now = self._now()
+        for ranking in self._rankings.values():
+            ranking.record(poll.id, now)
+
+        self._meta[poll.id] = {"question": poll.question, "total": poll.get_total_votes()}
+
+        if now - self._last_prune >= PRUNE_INTERVAL:
+            self._prune(now)
+
+    def top(self, window_seconds: int, limit: int) -> list[dict]:
+        now = self._now()
+        if now - self._last_prune >= PRUNE_INTERVAL:
+            self._prune(now)
+
+        return [
+            {
+                "pollId":   poll_id,
+                "question": self._meta[poll_id]["question"],
+                "total":    self._meta[poll_id]["total"],
+                "score":    round(score, 2),
+            }
+            for poll_id, score in self._rankings[window_seconds].top(limit, now)
+        ]
+
+    def _prune(self, now: float) -> None:
+        for ranking in self._rankings.values():
+            ranking.prune(now)
+
+        # La ventana más larga es la última en olvidar una encuesta.
+        longest = self._rankings[self._windows[-1]]
+        for poll_id in [pid for pid in self._meta if pid not in longest]:
+            del self._meta[poll_id]
+
+        self._last_prune = now
+
+    def _now(self) -> float:
+        return time.monotonic() - self._epoch
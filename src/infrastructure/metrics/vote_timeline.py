@@ -0,0 +1,238 @@
+import asyncio
+import time
+from array import array
+from src.domain.model.poll import Poll
+from src.domain.port.vote_rollup_repository import IVoteRollupRepository
+from src.domain.port.vote_listener import IVoteListener
+from src.domain.port.vote_timeline import IVoteTimeline
+
+# resolución -> (segundos por intervalo, intervalos retenidos)
+RESOLUTIONS: dict[str, tuple[int, int]] = {
+    "1s": (1, 300),     # últimos 5 minutos
+    "1m": (60, 180),    # últimas 3 horas
+}
+
+# Resolución que se persiste en MySQL.
+PERSISTED = "1m"
+
+# Lecturas repetidas si un flush se cruza con la hidratación de una encuesta.
+HYDRATE_ATTEMPTS = 3
+
+
+class _Ring:
+    """
+    Buffer circular de tamaño fijo con un conteo por opción en cada intervalo.
+
+    `_stamps[i]` guarda a qué intervalo pertenece la ranura i; si no coincide con el
+    intervalo que se escribe o lee, la ranura es de una vuelta anterior y vale cero.
+    """
+
+    def __init__(self, step: int, size: int, num_options: int) -> None:
+        self.step    = step
+        self.size    = size
+        self._n      = num_options
+        self._stamps = array("q", [-1]) * size
+        self._counts = array("I", [0]) * (size * num_options)
+
+    def add(self, bucket: int, option_index: int, amount: int = 1) -> None:
+        row = self._row(bucket)
+        self._counts[row + option_index] += amount
+
+    def raise_to(self, bucket: int, option_index: int, value: int) -> None:
+        """Sube el conteo a `value` si es mayor; nunca lo baja."""
+        row = self._row(bucket)
+        if value > self._counts[row + option_index]:
+            self._counts[row + option_index] = value
+
+    def get(self, bucket: int) -> list[int]:
+        slot = bucket % self.size
+        if self._stamps[slot] != bucket:
+            return [0] * self._n
+        row = slot * self._n
+        return self._counts[row:row + self._n].tolist()
+
+    def _row(self, bucket: int) -> int:
+        slot = bucket % self.size
+        row  = slot * self._n
+        if self._stamps[slot] != bucket:
+            self._stamps[slot] = bucket
+            for i in range(row, row + self._n):
+                self._counts[i] = 0
+        return row
+
+
+class _PollSeries:
+
+    def __init__(self, poll: Poll) -> None:
+        self.options    = list(poll.options)
+        self.rings      = {name: _Ring(step, size, len(poll.options)) for name, (step, size) in RESOLUTIONS.items()}
+        self.hydrated   = False
+        self.last_used  = time.time()
+
+
+class RingBufferVoteTimeline(IVoteTimeline):
+    """
+    Conteos de votos por segundo y por minuto de cada opción, en buffers circulares.
+
+    La memoria por encuesta es fija sin importar el volumen de votos. Los conteos por
+    minuto se acumulan en `_pending` y `flush()` los suma en MySQL; como se persisten
+    deltas, varios procesos pueden escribir sobre la misma encuesta sin pisarse.
+    """
+
+    def __init__(self, rollup_repository: IVoteRollupRepository) -> None:
+        self._rollups = rollup_repository
+        self._series:  dict[str, _PollSeries]            = {}
+        self._pending: dict[tuple[str, int, int], int]   = {}
+        self._lock     = asyncio.Lock()
+        self._hydrate_locks: dict[str, asyncio.Lock] = {}
+        # Impar mientras hay un flush en curso; cambia al empezar y al terminar cada uno.
+        self._flush_seq = 0
+
+    @property
+    def resolutions(self) -> tuple[str, ...]:
+        return tuple(RESOLUTIONS)
+
+    def has(self, poll_id: str) -> bool:
+        series = self._series.get(poll_id)
+        return series is not None and series.hydrated
+
+    @property
+    def replica(self) -> IVoteListener:
+        """Listener para votos de otros workers: actualiza las series sin volver a persistirlos."""
+        return _ReplicaListener(self)
+
+    def on_vote(self, poll: Poll, option_index: int) -> None:
+        self._record(poll, option_index, persist=True)
+
+    def _record(self, poll: Poll, option_index: int, persist: bool) -> None:
+        now    = time.time()
+        series = self._series.get(poll.id)
+        if series is None:
+            series = self._series[poll.id] = _PollSeries(poll)
+
+        for ring in series.rings.values():
+            ring.add(int(now // ring.step), option_index)
+        series.last_used = now
+
+        if not persist:
+            return
+
+        key = (poll.id, option_index, int(now // series.rings[PERSISTED].step))
+        self._pending[key] = self._pending.get(key, 0) + 1
+
+    async def hydrate(self, poll: Poll) -> None:
+        # Un lock por encuesta: la primera lectura de una no espera a las demás ni a flush().
+        lock = self._hydrate_locks.setdefault(poll.id, asyncio.Lock())
+        try:
+            async with lock:
+                await self._hydrate(poll)
+        finally:
+            if not lock.locked():
+                self._hydrate_locks.pop(poll.id, None)
+
+    async def _hydrate(self, poll: Poll) -> None:
+        series = self._series.get(poll.id)
+        if series is None:
+            series = self._series[poll.id] = _PollSeries(poll)
+        if series.hydrated:
+            return
+
+        ring  = series.rings[PERSISTED]
+        since = int(time.time() // ring.step) - ring.size + 1
+
+        # Lo persistido incluye los votos de este proceso ya enviados en flush(); solo hay
+        # que sumarle lo pendiente. Si un flush se cruza con la lectura no se sabe si sus
+        # deltas entraron, así que se vuelve a leer.
+        #
+        # El ring ya tiene los votos que este proceso vio desde que existe la serie, incluidos
+        # los de otros workers (réplica) que quizá aún no llegaron a MySQL. Por eso se toma el
+        # máximo entre lo visto y lo persistido: la hidratación nunca baja un intervalo.
+        for _ in range(HYDRATE_ATTEMPTS):
+            seq  = self._flush_seq
+            rows = await self._rollups.find_minute_rollups(poll.id, since)
+            if seq % 2 == 0 and seq == self._flush_seq:
+                break
+
+        for position, minute, votes in rows:
+            if 0 <= position < len(series.options):
+                pending = self._pending.get((poll.id, position, minute), 0)
+                ring.raise_to(minute, position, votes + pending)
+
+        series.hydrated  = True
+        series.last_used = time.time()
+
+    def series(self, poll_id: str, resolution: str) -> dict:
+        series = self._get(poll_id)
+        series.last_used = time.time()
+
+        ring   = series.rings[resolution]
+        newest = int(time.time() // ring.step)
+        oldest = newest - ring.size + 1
+
+        buckets = [ring.get(b) for b in range(oldest, newest + 1)]
+        return {
+            "pollId":     poll_id,
+            "resolution": resolution,
+            "step":       ring.step,
+            "start":      oldest * ring.step,
+            "options":    series.options,
+            "series":     [list(option_counts) for option_counts in zip(*buckets)],
+        }
+
+    def recent(self, poll_id: str, resolution: str, count: int) -> dict:
+        ring   = self._get(poll_id).rings[resolution]
+        newest = int(time.time() // ring.step)
+        count  = max(1, min(count, ring.size))
+        return {
+            "pollId":     poll_id,
+            "resolution": resolution,
+            "buckets": [
+                {"timestamp": b * ring.step, "votes": ring.get(b)}
+                for b in range(newest - count + 1, newest + 1)
+            ],
+        }
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if not self._pending:
+                self._evict_idle()
+                return
+
+            pending, self._pending = self._pending, {}
+            rows = [(poll_id, position, minute, votes) for (poll_id, position, minute), votes in pending.items()]
+            self._flush_seq += 1
+            try:
+                await self._rollups.add_minute_rollups(rows)
+            except BaseException:
+                # También ante cancelación: se reintenta en el próximo flush sumando lo que
+                # llegó mientras tanto.
+                for key, votes in pending.items():
+                    self._pending[key] = self._pending.get(key, 0) + votes
+                raise
+            finally:
+                self._flush_seq += 1
+
+            self._evict_idle()
+
+    def _evict_idle(self) -> None:
+        """Libera encuestas sin votos ni consultas durante todo el rango de la resolución más larga."""
+        horizon = max(step * size for step, size in RESOLUTIONS.values())
+        cutoff  = time.time() - horizon
+        pending_polls = {poll_id for poll_id, _, _ in self._pending}
+        for poll_id in [pid for pid, s in self._series.items() if s.last_used < cutoff and pid not in pending_polls]:
+            del self._series[poll_id]
+
+    def _get(self, poll_id: str) -> _PollSeries:
+        series = self._series.get(poll_id)
+        if series is None:
+            raise ValueError(f"Encuesta '{poll_id}' sin serie de votos cargada.")
+        return series
+
+
+class _ReplicaListener(IVoteListener):
+
+    def __init__(self, timeline: RingBufferVoteTimeline) -> None:
+        self._timeline = timeline
+
+    def on_vote(self, poll: Poll, option_index: int) -> None:
+        self._timeline._record(poll, option_index, persist=False)
@@ -1,9 +1,52 @@
-from fastapi import APIRouter
+import os
+import asyncio
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+from src.infrastructure.database.database import ping
 
 router = APIRouter(tags=["Status"])
 
+READY_DB_TIMEOUT = float(os.getenv("READY_DB_TIMEOUT", 1))
+# Sin sincronizar durante este tiempo, el worker deja de recibir votos de los demás.
+READY_BUS_MAX_LAG = float(os.getenv("READY_BUS_MAX_LAG", 5))
+
 
 @router.get("/health")
 async def health_check():
     """Verifica que el servidor esté corriendo."""
     return {"status": "ok", "service": "LivePoll"}
+
+
+@router.get("/ready")
+async def readiness_check(req: Request):
+    """
+    Indica si este proceso puede recibir tráfico. A diferencia de /health, responde 503
+    si la base de datos no contesta, si el bus entre workers dejó de sincronizar o si el
+    proceso está drenando conexiones para apagarse.
+    uvicorn solo atiende peticiones después del precalentamiento, que falla sin base de datos.
+    """
+    handler   = req.app.state.handler
+    event_bus = getattr(req.app.state, "event_bus", None)
+
+    if handler.draining:
+        status = "draining"
+    else:
+        try:
+            await asyncio.wait_for(ping(), timeout=READY_DB_TIMEOUT)
+            status = "ready"
+        except Exception:
+            status = "db_unavailable"
+
+    if status == "ready" and event_bus is not None and not event_bus.is_healthy(READY_BUS_MAX_LAG):
+        status = "event_bus_unavailable"
+
+    return JSONResponse(
+        status_code = 200 if status == "ready" else 503,
+        content     = {
+            "status":           status,
+            "startupMs":        getattr(req.app.state, "startup_ms", None),
+            "searchIndexReady": handler._search_polls.index_ready,
+            "searchIndexError": getattr(req.app.state, "search_index_error", None),
+            "eventBus":         event_bus.status() if event_bus is not None else None,
+        },
+    )
@@ -1,6 +1,7 @@
 import logging
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel
+from src.domain.exceptions import PollNotFoundError
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,43 @@ class PollResponse(BaseModel):
     percentages: list[int]
 
 
+class SearchHit(BaseModel):
+    pollId: str
+    question: str
+    options: list[str]
+    score: float
+
+
+class SearchResponse(BaseModel):
+    query: str
+    total: int
+    limit: int
+    offset: int
+    indexReady: bool
+    results: list[SearchHit]
+
+
+class TrendingPoll(BaseModel):
+    pollId: str
+    question: str
+    total: int
+    score: float
+
+
+class TrendingResponse(BaseModel):
+    window: str
+    polls: list[TrendingPoll]
+
+
+class TimelineResponse(BaseModel):
+    pollId: str
+    resolution: str
+    step: int
+    start: int
+    options: list[str]
+    series: list[list[int]]
+
+
 def create_polls_router():
     router = APIRouter(prefix="/api/polls", tags=["Polls"])
 
@@ -38,6 +76,69 @@ def create_polls_router():
             logger.error(f"[ListPolls] Error inesperado: {type(e).__name__}: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500, detail=f"Error al listar encuestas: {str(e)}")
 
+    @router.get("/search", response_model=SearchResponse)
+    async def search_polls(
+        req: Request,
+        q: str = Query(..., description="Texto a buscar en preguntas y opciones"),
+        limit: int = Query(20),
+        offset: int = Query(0),
+    ):
+        """
+        Busca encuestas por texto usando el índice en memoria.
+
+        - **q**: términos de búsqueda; ignora acentos y admite prefijos ("cancio" encuentra "Canción")
+        - **limit** / **offset**: paginación de resultados ordenados por relevancia
+        """
+        try:
+            handler = req.app.state.handler
+            total, hits = await handler._search_polls.execute(query=q, limit=limit, offset=offset)
+            return {
+                "query":      q,
+                "total":      total,
+                "limit":      limit,
+                "offset":     offset,
+                "indexReady": handler._search_polls.index_ready,
+                "results": [
+                    {
+                        "pollId":   poll.id,
+                        "question": poll.question,
+                        "options":  poll.options,
+                        "score":    round(score, 3),
+                    }
+                    for poll, score in hits
+                ],
+            }
+
+        except ValueError as e:
+            logger.error(f"[SearchPolls] ValueError: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"[SearchPolls] Error inesperado: {type(e).__name__}: {str(e)}", exc_info=True)
+            raise HTTPException(status_code=500, detail=f"Error al buscar encuestas: {str(e)}")
+
+    @router.get("/trending", response_model=TrendingResponse)
+    async def trending_polls(req: Request, window: str = Query("5m"), limit: int = Query(20)):
+        """
+        Encuestas con más votos recientes, calculadas en memoria sin consultar MySQL.
+
+        - **window**: constante de tiempo del decaimiento (1m, 5m, 15m o 1h)
+        - **limit**: cantidad máxima de encuestas a devolver
+
+        `score` suma cada voto ponderado por e^(-edad/window): un voto de hace una
+        ventana cuenta ~0.37. Con ritmo constante equivale a los votos por ventana.
+        """
+        try:
+            handler = req.app.state.handler
+            polls = await handler._trending.execute(window=window, limit=limit)
+            return {"window": window, "polls": polls}
+
+        except ValueError as e:
+            logger.error(f"[Trending] ValueError: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"[Trending] Error inesperado: {type(e).__name__}: {str(e)}", exc_info=True)
+            raise HTTPException(status_code=500, detail=f"Error al obtener tendencias: {str(e)}")
+
     @router.post("", response_model=PollResponse)
     async def create_poll(request: CreatePollRequest, req: Request):
         try:
@@ -86,6 +187,30 @@ def create_polls_router():
             logger.error(f"[Vote] Error inesperado: {type(e).__name__}: {str(e)}", exc_info=True)
             raise HTTPException(status_code=500, detail=f"Error al votar: {str(e)}")
 
+    @router.get("/{poll_id}/timeline", response_model=TimelineResponse)
+    async def get_poll_timeline(poll_id: str, req: Request, resolution: str = Query("1s")):
+        """
+        Votos por opción a lo largo del tiempo, para gráficas en vivo.
+
+        - **poll_id**: ID de la encuesta
+        - **resolution**: `1s` (últimos 5 minutos) o `1m` (últimas 3 horas)
+
+        `series[i]` contiene los conteos de la opción i, un valor por intervalo desde `start`.
+        """
+        try:
+            handler = req.app.state.handler
+            return await handler._timeline.execute(poll_id=poll_id, resolution=resolution)
+
+        except PollNotFoundError as e:
+            logger.error(f"[Timeline] PollNotFoundError: {str(e)}")
+            raise HTTPException(status_code=404, detail=str(e))
+        except ValueError as e:
+            logger.error(f"[Timeline] ValueError: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            logger.error(f"[Timeline] Error inesperado: {type(e).__name__}: {str(e)}", exc_info=True)
+            raise HTTPException(status_code=500, detail=f"Error al obtener la serie de votos: {str(e)}")
+
     @router.get("/{poll_id}", response_model=PollResponse)
     async def get_poll(poll_id: str, req: Request):
         """
@@ -0,0 +1,131 @@
+import asyncio
+import bisect
+import re
+import unicodedata
+from src.domain.model.poll import Poll
+from src.domain.port.poll_search_index import IPollSearchIndex
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Peso de cada campo y penalización cuando el término solo coincide como prefijo.
+QUESTION_WEIGHT = 2.0
+OPTION_WEIGHT   = 1.0
+PREFIX_FACTOR   = 0.5
+
+# Cada cuántas encuestas se cede el event loop durante la carga masiva.
+REBUILD_BATCH = 500
+
+
+def normalize(text: str) -> str:
+    """Pasa a minúsculas y elimina acentos: "Canción" -> "cancion", "Año" -> "ano"."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped   = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return stripped.casefold()
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(normalize(text))
+
+
+class InMemoryPollSearchIndex(IPollSearchIndex):
+    """
+    Índice invertido en memoria sobre la pregunta y el texto de las opciones.
+
+    - `_postings`: término -> {poll_id: peso del campo donde aparece}
+    - `_vocab`: términos ordenados, para resolver prefijos con bisect.
+    """
+
+    def __init__(self) -> None:
+        self._polls:    dict[str, Poll]             = {}
+        self._terms:    dict[str, set[str]]         = {}
+        self._postings: dict[str, dict[str, float]] = {}
+        self._vocab:    list[str]                   = []
+        self._bulk      = False
+        self._ready     = False
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def __len__(self) -> int:
+        return len(self._polls)
+
+    def add(self, poll: Poll) -> None:
+        self._discard(poll.id)
+
+        weights: dict[str, float] = {}
+        for token in tokenize(" ".join(poll.options)):
+            weights[token] = OPTION_WEIGHT
+        for token in tokenize(poll.question):
+            weights[token] = QUESTION_WEIGHT
+
+        for token, weight in weights.items():
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = {}
+                if not self._bulk:
+                    bisect.insort(self._vocab, token)
+            posting[poll.id] = weight
+
+        self._polls[poll.id] = poll
+        self._terms[poll.id] = set(weights)
+
+    async def rebuild(self, polls: list[Poll]) -> None:
+        # Durante la carga se omite insort y el vocabulario se ordena una sola vez al final.
+        self._bulk = True
+        try:
+            for i, poll in enumerate(polls, start=1):
+                self.add(poll)
+                if i % REBUILD_BATCH == 0:
+                    await asyncio.sleep(0)
+        finally:
+            self._vocab = sorted(self._postings)
+            self._bulk  = False
+        self._ready = True
+        print(f"[SearchIndex] Índice construido: {len(self._polls)} encuestas, {len(self._vocab)} términos ✓")
+
+    def search(self, query: str, limit: int, offset: int) -> tuple[int, list[tuple[Poll, float]]]:
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return 0, []
+
+        scores: dict[str, float] | None = None
+        for term in terms:
+            term_scores = self._match_term(term)
+            if scores is None:
+                scores = term_scores
+            else:
+                # Todos los términos deben coincidir (AND).
+                scores = {pid: s + term_scores[pid] for pid, s in scores.items() if pid in term_scores}
+            if not scores:
+                return 0, []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        page   = ranked[offset:offset + limit]
+        return len(ranked), [(self._polls[pid], score) for pid, score in page]
+
+    def _match_term(self, term: str) -> dict[str, float]:
+        """Mejor puntaje por encuesta para un término, contando coincidencias exactas y por prefijo."""
+        matches: dict[str, float] = {}
+        i = bisect.bisect_left(self._vocab, term)
+        while i < len(self._vocab) and self._vocab[i].startswith(term):
+            token  = self._vocab[i]
+            factor = 1.0 if token == term else PREFIX_FACTOR
+            i += 1
+            for poll_id, weight in self._postings.get(token, {}).items():
+                score = weight * factor
+                if score > matches.get(poll_id, 0.0):
+                    matches[poll_id] = score
+        return matches
+
+    def _discard(self, poll_id: str) -> None:
+        for token in self._terms.pop(poll_id, ()):
+            posting = self._postings[token]
+            posting.pop(poll_id, None)
+            if not posting:
+                del self._postings[token]
+                if not self._bulk:
+                    i = bisect.bisect_left(self._vocab, token)
+                    if i < len(self._vocab) and self._vocab[i] == token:
+                        del self._vocab[i]
+        self._polls.pop(poll_id, None)
@@ -1,25 +1,60 @@
 import os
+import time
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware  
 from dotenv import load_dotenv
-from src.infrastructure.database.database import create_pool, close_pool
-from src.infrastructure.dependencies       import build_handler
+from src.infrastructure.database.database import create_pool, close_pool, warm_pool
+from src.infrastructure.dependencies       import build_handler, build_event_bus
 from src.infrastructure.routes.health      import router as health_router
 from src.infrastructure.routes.polls       import create_polls_router
+from src.infrastructure.websocket.websocket_handler import DRAIN_RECONNECT_MAX_MS
 
 
 load_dotenv()
 
+TIMELINE_FLUSH_INTERVAL = float(os.getenv("TIMELINE_FLUSH_INTERVAL", 10))
+WARMUP_TIMEOUT          = float(os.getenv("WARMUP_TIMEOUT", 15))
+WARMUP_HOT_POLLS        = int(os.getenv("WARMUP_HOT_POLLS", 100))
+# Las encuestas precargadas deben seguir en caché mientras reconectan los clientes del
+# proceso anterior (hasta DRAIN_RECONNECT_MAX_MS), con margen para despliegues escalonados.
+WARMUP_CACHE_TTL        = float(os.getenv("WARMUP_CACHE_TTL", DRAIN_RECONNECT_MAX_MS / 1000 + 20))
+INDEX_RETRY_MAX_DELAY   = float(os.getenv("INDEX_RETRY_MAX_DELAY", 60))
+
 
 def create_app() -> FastAPI:
+    started = time.perf_counter()
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         await create_pool()
-        handler = build_handler()
+        event_bus = build_event_bus()
+        handler   = build_handler(event_bus)
+
+        app.state.handler   = handler
+        app.state.event_bus = event_bus
+
+        # uvicorn no atiende conexiones hasta salir de aquí, así que todo lo que se espera
+        # ocurre antes de recibir tráfico. Sin base de datos el worker no arranca; la
+        # caché de encuestas activas es opcional y un fallo solo se registra.
+        await asyncio.wait_for(warm_pool(), timeout=WARMUP_TIMEOUT)
+        if event_bus is not None:
+            # Con varios workers, sin la tabla poll_events las salas no se sincronizan.
+            await asyncio.wait_for(event_bus.start(), timeout=WARMUP_TIMEOUT)
+        try:
+            await asyncio.wait_for(_warm_up(handler), timeout=WARMUP_TIMEOUT)
+        except Exception as e:
+            print(f"[Server] Caché de encuestas activas incompleta: {type(e).__name__}: {e}")
+
+        app.state.startup_ms = round((time.perf_counter() - started) * 1000)
+        print(f"[Server] Listo en {app.state.startup_ms} ms (pid {os.getpid()})")
 
-        app.state.handler = handler
+        # El índice de búsqueda se construye en segundo plano para no retrasar el arranque.
+        app.state.search_index_error = None
+        index_task = asyncio.create_task(_rebuild_search_index(app, handler))
+        flush_task = asyncio.create_task(_persist_timeline(handler))
+        bus_task   = asyncio.create_task(event_bus.run()) if event_bus is not None else None
 
         port = os.getenv("WS_PORT", "8000")
         print(f"LivePoll FastAPI corriendo en ws://localhost:{port}/ws")
@@ -29,6 +64,13 @@ def create_app() -> FastAPI:
 
         yield  
 
+        await _cancel(index_task)
+        if bus_task is not None:
+            await _cancel(bus_task)
+            await event_bus.close()
+        # Se espera a que el ciclo termine antes del flush final para no cortar una escritura.
+        await _cancel(flush_task)
+        await _flush_timeline(handler)
         await close_pool()
         print("\n[Server] Servidor detenido.")
 
@@ -56,4 +98,46 @@ def create_app() -> FastAPI:
     async def websocket_endpoint(websocket: WebSocket):
         await app.state.handler.handle_connection(websocket)
 
-    return app
\ No newline at end of file
+    return app
+
+
+async def _warm_up(handler) -> None:
+    cached = await handler._warm_up.execute(limit=WARMUP_HOT_POLLS, ttl=WARMUP_CACHE_TTL)
+    print(f"[Server] {cached} encuestas activas precargadas en caché ✓")
+
+
+async def _rebuild_search_index(app: FastAPI, handler) -> None:
+    """Reintenta con espera creciente hasta construir el índice; el último error se expone en /ready."""
+    delay = 1.0
+    while True:
+        try:
+            await handler._search_polls.rebuild_index()
+            app.state.search_index_error = None
+            return
+        except Exception as e:
+            app.state.search_index_error = f"{type(e).__name__}: {e}"
+            print(f"[SearchIndex] Error construyendo el índice, reintento en {delay:.0f}s: {app.state.search_index_error}")
+
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, INDEX_RETRY_MAX_DELAY)
+
+
+async def _cancel(task: asyncio.Task) -> None:
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def _persist_timeline(handler) -> None:
+    while True:
+        await asyncio.sleep(TIMELINE_FLUSH_INTERVAL)
+        await _flush_timeline(handler)
+
+
+async def _flush_timeline(handler) -> None:
+    try:
+        await handler._timeline.persist()
+    except Exception as e:
+        print(f"[Timeline] Error persistiendo conteos: {type(e).__name__}: {e}")
\ No newline at end of file
@@ -1,7 +1,8 @@
 import json
 
 class MessageParser:
-    VALID_TYPES = {"CREATE_POLL", "JOIN_POLL", "VOTE"}
+    VALID_TYPES = {"CREATE_POLL", "JOIN_POLL", "VOTE", "SUBSCRIBE_TRENDING", "UNSUBSCRIBE_TRENDING",
+                   "SUBSCRIBE_TIMELINE", "UNSUBSCRIBE_TIMELINE"}
 
     def parse(self, raw_message: str) -> dict:
         try:
@@ -1,29 +1,74 @@
+import os
 import json
+import random
 import asyncio
 from fastapi import WebSocket, WebSocketDisconnect
 from src.application.usecase.create_poll_usecase import CreatePollUseCase
 from src.application.usecase.get_poll_usecase    import GetPollUseCase
 from src.application.usecase.vote_usecase        import VoteUseCase
+from src.application.usecase.search_polls_usecase import SearchPollsUseCase
+from src.application.usecase.get_trending_usecase import GetTrendingUseCase
+from src.application.usecase.get_timeline_usecase import GetTimelineUseCase
+from src.application.usecase.warm_up_usecase     import WarmUpUseCase
+from src.domain.model.poll import Poll
+from src.domain.port.vote_listener import IVoteListener
 from src.infrastructure.websocket.message_parser import MessageParser
 
-class WebSocketHandler:
+# Como máximo un TRENDING_UPDATE por intervalo, aunque lleguen muchos votos.
+TRENDING_PUSH_INTERVAL = 1.0
+TIMELINE_PUSH_INTERVAL = 1.0
+
+# Al apagar, cada cliente recibe un retraso aleatorio en este rango antes de reconectar,
+# para que no vuelvan todos a la vez al siguiente proceso.
+DRAIN_RECONNECT_MIN_MS = int(os.getenv("DRAIN_RECONNECT_MIN_MS", 500))
+DRAIN_RECONNECT_MAX_MS = int(os.getenv("DRAIN_RECONNECT_MAX_MS", 10000))
+DRAIN_GRACE_SECONDS    = float(os.getenv("DRAIN_GRACE_SECONDS", 1))
+
+# 1012 = "Service Restart" (RFC 6455)
+CLOSE_SERVICE_RESTART = 1012
+
+class WebSocketHandler(IVoteListener):
 
     def __init__(
         self,
         create_poll_usecase: CreatePollUseCase,
         get_poll_usecase:    GetPollUseCase,
         vote_usecase:        VoteUseCase,
+        search_polls_usecase: SearchPollsUseCase,
+        get_trending_usecase: GetTrendingUseCase,
+        get_timeline_usecase: GetTimelineUseCase,
+        warm_up_usecase:      WarmUpUseCase,
     ) -> None:
-        self._create_poll = create_poll_usecase
-        self._get_poll    = get_poll_usecase
-        self._vote        = vote_usecase
+        self._create_poll  = create_poll_usecase
+        self._get_poll     = get_poll_usecase
+        self._vote         = vote_usecase
+        self._search_polls = search_polls_usecase
+        self._trending     = get_trending_usecase
+        self._timeline     = get_timeline_usecase
+        self._warm_up      = warm_up_usecase
         self._parser      = MessageParser()
 
         self._rooms: dict[str, set] = {}
+        self._connections: set = set()
+        self._background: set[asyncio.Task] = set()
+        self._last_totals: dict[str, int] = {}
+        self._draining = False
+        self._trending_subscribers: dict = {}
+        self._trending_push_task: asyncio.Task | None = None
+        self._timeline_subscribers: dict[str, dict] = {}
+        self._timeline_subscriptions: dict = {}
+        self._timeline_push_tasks: dict[str, asyncio.Task] = {}
 
     async def handle_connection(self, websocket: WebSocket) -> None:
         await websocket.accept()
+
+        if self._draining:
+            await self._send_reconnect(websocket)
+            await websocket.close(code=CLOSE_SERVICE_RESTART)
+            return
+
         print(f"[WS] Nueva conexión: {websocket.client}")
+        self._connections.add(websocket)
 
         poll_id_ref = {"value": None}
 
@@ -37,7 +82,10 @@ class WebSocketHandler:
         except Exception as e:
             print(f"[WS] Error inesperado: {e}")
         finally:
+            self._connections.discard(websocket)
             self._leave_room(websocket, poll_id_ref["value"])
+            self._trending_subscribers.pop(websocket, None)
+            self._unsubscribe_timeline(websocket)
             print(f"[WS] Conexión cerrada: {websocket.client}")
 
     async def _handle_message(self, websocket, raw_message: str, poll_id_ref: dict) -> None:
@@ -55,6 +103,14 @@ class WebSocketHandler:
             await self._handle_join_poll(websocket, data, poll_id_ref)
         elif msg_type == "VOTE":
             await self._handle_vote(websocket, data)
+        elif msg_type == "SUBSCRIBE_TRENDING":
+            await self._handle_subscribe_trending(websocket, data)
+        elif msg_type == "UNSUBSCRIBE_TRENDING":
+            self._trending_subscribers.pop(websocket, None)
+        elif msg_type == "SUBSCRIBE_TIMELINE":
+            await self._handle_subscribe_timeline(websocket, data)
+        elif msg_type == "UNSUBSCRIBE_TIMELINE":
+            self._unsubscribe_timeline(websocket)
 
     async def _handle_create_poll(self, websocket, data: dict, poll_id_ref: dict) -> None:
         try:
@@ -100,12 +156,146 @@ class WebSocketHandler:
                 poll_id=poll_id, option_index=int(option_index)
             )
 
-            await self._broadcast_to_room(poll.id, {"type": "POLL_UPDATE", **poll.to_result()})
+            # POLL_UPDATE lo envía on_vote, que también recibe votos por HTTP y de otros workers.
             print(f"[Handler] Voto registrado — sala: {poll.id}")
 
         except (ValueError, RuntimeError) as e:
             await self._send_error(websocket, str(e))
 
+    async def _handle_subscribe_trending(self, websocket, data: dict) -> None:
+        try:
+            window = str(data.get("window", "5m"))
+            limit  = int(data.get("limit", 20))
+            polls  = await self._trending.execute(window=window, limit=limit)
+
+            self._trending_subscribers[websocket] = (window, limit)
+            await self._send(websocket, {"type": "TRENDING_UPDATE", "window": window, "polls": polls})
+
+        except (ValueError, TypeError) as e:
+            await self._send_error(websocket, str(e))
+
+    def on_vote(self, poll: Poll, option_index: int) -> None:
+        # Registrado en VoteUseCase y en ClusterSync: todo voto, venga por WS, por HTTP o
+        # de otro worker, llega a las salas de este proceso.
+        # Tras una caída del bus llegan instantáneas viejas: como en CachedPollRepository,
+        # no se difunde un estado con menos votos que el último enviado a la sala.
+        if poll.id in self._rooms:
+            total = poll.get_total_votes()
+            if total >= self._last_totals.get(poll.id, 0):
+                self._last_totals[poll.id] = total
+                self._spawn(self._broadcast_to_room(poll.id, {"type": "POLL_UPDATE", **poll.to_result()}))
+        self._schedule_trending_push()
+        self._schedule_timeline_push(poll.id)
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def _schedule_trending_push(self) -> None:
+        if not self._trending_subscribers:
+            return
+        if self._trending_push_task is not None and not self._trending_push_task.done():
+            return
+        self._trending_push_task = asyncio.create_task(self._push_trending())
+
+    async def _push_trending(self) -> None:
+        await asyncio.sleep(TRENDING_PUSH_INTERVAL)
+
+        groups: dict[tuple[str, int], list] = {}
+        for client, key in list(self._trending_subscribers.items()):
+            groups.setdefault(key, []).append(client)
+
+        for (window, limit), clients in groups.items():
+            polls    = await self._trending.execute(window=window, limit=limit)
+            json_msg = json.dumps({"type": "TRENDING_UPDATE", "window": window, "polls": polls})
+            await asyncio.gather(
+                *[client.send_text(json_msg) for client in clients],
+                return_exceptions=True,
+            )
+
+    async def _handle_subscribe_timeline(self, websocket, data: dict) -> None:
+        try:
+            resolution = str(data.get("resolution", "1s"))
+            state      = await self._timeline.execute(poll_id=data.get("pollId", ""), resolution=resolution)
+
+            self._unsubscribe_timeline(websocket)
+            self._timeline_subscribers.setdefault(state["pollId"], {})[websocket] = resolution
+            self._timeline_subscriptions[websocket] = state["pollId"]
+
+            await self._send(websocket, {"type": "TIMELINE_STATE", **state})
+
+        except (ValueError, RuntimeError) as e:
+            await self._send_error(websocket, str(e))
+
+    def _unsubscribe_timeline(self, websocket) -> None:
+        poll_id = self._timeline_subscriptions.pop(websocket, None)
+        if poll_id and poll_id in self._timeline_subscribers:
+            self._timeline_subscribers[poll_id].pop(websocket, None)
+            if not self._timeline_subscribers[poll_id]:
+                del self._timeline_subscribers[poll_id]
+
+    def _schedule_timeline_push(self, poll_id: str) -> None:
+        if poll_id not in self._timeline_subscribers:
+            return
+        task = self._timeline_push_tasks.get(poll_id)
+        if task is not None and not task.done():
+            return
+        self._timeline_push_tasks[poll_id] = asyncio.create_task(self._push_timeline(poll_id))
+
+    async def _push_timeline(self, poll_id: str) -> None:
+        await asyncio.sleep(TIMELINE_PUSH_INTERVAL)
+        self._timeline_push_tasks.pop(poll_id, None)
+
+        groups: dict[str, list] = {}
+        for client, resolution in list(self._timeline_subscribers.get(poll_id, {}).items()):
+            groups.setdefault(resolution, []).append(client)
+
+        for resolution, clients in groups.items():
+            # Se envían los dos últimos intervalos para no perder el cierre del anterior.
+            try:
+                update = self._timeline.recent(poll_id, resolution)
+            except ValueError:
+                continue
+            json_msg = json.dumps({"type": "TIMELINE_UPDATE", **update})
+            await asyncio.gather(
+                *[client.send_text(json_msg) for client in clients],
+                return_exceptions=True,
+            )
+
+    @property
+    def draining(self) -> bool:
+        return self._draining
+
+    async def drain(self) -> int:
+        """
+        Pide a todos los clientes que reconecten con un retraso aleatorio y cierra los sockets.
+        Las conexiones nuevas que lleguen mientras tanto reciben el mismo aviso.
+        """
+        self._draining = True
+        clients = list(self._connections)
+        if not clients:
+            return 0
+
+        print(f"[WS] Drenando {len(clients)} conexiones...")
+        await asyncio.gather(*[self._send_reconnect(c) for c in clients], return_exceptions=True)
+
+        # Margen para que los mensajes salgan antes de cerrar.
+        await asyncio.sleep(DRAIN_GRACE_SECONDS)
+        await asyncio.gather(
+            *[c.close(code=CLOSE_SERVICE_RESTART) for c in clients],
+            return_exceptions=True,
+        )
+        print(f"[WS] {len(clients)} conexiones drenadas.")
+        return len(clients)
+
+    async def _send_reconnect(self, websocket) -> None:
+        await self._send(websocket, {
+            "type":         "RECONNECT",
+            "retryAfterMs": random.randint(DRAIN_RECONNECT_MIN_MS, DRAIN_RECONNECT_MAX_MS),
+            "maxBackoffMs": DRAIN_RECONNECT_MAX_MS,
+        })
+
     def _join_room(self, websocket, poll_id: str) -> None:
         if poll_id not in self._rooms:
             self._rooms[poll_id] = set()
@@ -116,6 +306,7 @@ class WebSocketHandler:
             self._rooms[poll_id].discard(websocket)
             if not self._rooms[poll_id]:
                 del self._rooms[poll_id]
+                self._last_totals.pop(poll_id, None)
 
     async def _broadcast_to_room(self, poll_id: str, message: dict) -> None:
         room = self._rooms.get(poll_id, set())